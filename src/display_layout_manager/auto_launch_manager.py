@@ -5,20 +5,32 @@ Display Layout Manager - Auto Launch Manager
 """
 
 import os
-import plistlib
-import shutil
-import subprocess
 from pathlib import Path
+from typing import Optional
+
+# plistlib / shutil / subprocess は自動起動の切り替え時にしか使わないため、
+# メニューバー起動コストを抑える目的で各メソッド内で遅延インポートする
+
+
+class AutoLaunchError(RuntimeError):
+    """自動起動の有効化・無効化に失敗した場合の例外"""
 
 
 class AutoLaunchManager:
     """ログイン時の自動起動管理クラス"""
 
+    # シリアライズ済み plist のキャッシュ（クラス共有）
+    # 内容が同じ限り XML の再生成を省く（テスト中の enable/disable 往復で効く）
+    _plist_bytes_cache: dict = {}
+
     def __init__(self):
-        self.launch_agents_dir = Path.home() / "Library" / "LaunchAgents"
+        # Path.home() は passwd 参照を伴うため一度だけ評価して使い回す
+        self._home = Path.home()
+        self.launch_agents_dir = self._home / "Library" / "LaunchAgents"
         self.plist_path = (
             self.launch_agents_dir / "com.eijikominami.display-layout-manager.plist"
         )
+        self._executable_path: Optional[str] = None
 
     def is_enabled(self) -> bool:
         """
@@ -34,8 +46,11 @@ class AutoLaunchManager:
         自動起動を有効化
 
         Raises:
-            Exception: 有効化に失敗した場合
+            AutoLaunchError: 有効化に失敗した場合
         """
+        import plistlib
+        import subprocess
+
         try:
             # LaunchAgents ディレクトリを作成
             self.launch_agents_dir.mkdir(parents=True, exist_ok=True)
@@ -43,7 +58,7 @@ class AutoLaunchManager:
             # 実行ファイルのパスを取得
             executable_path = self._find_executable()
             if not executable_path:
-                raise Exception("display-layout-menubar が見つかりません")
+                raise AutoLaunchError("display-layout-menubar が見つかりません")
 
             # plist ファイルを作成
             # executable_path がスペースを含む場合（python コマンド）は分割
@@ -52,56 +67,93 @@ class AutoLaunchManager:
             else:
                 program_args = [executable_path]
 
+            # ログディレクトリを一度だけ組み立てて再利用し、
+            # 存在しない場合は作成しておく（無いと launchctl が
+            # ログファイルを開けずエラーを出す）
+            log_dir = self._home / "Library" / "Logs" / "DisplayLayoutManager"
+            log_dir.mkdir(parents=True, exist_ok=True)
+
             plist_data = {
                 "Label": "com.eijikominami.display-layout-manager",
                 "ProgramArguments": program_args,
                 "RunAtLoad": True,
                 "KeepAlive": False,
-                "StandardOutPath": str(
-                    Path.home()
-                    / "Library"
-                    / "Logs"
-                    / "DisplayLayoutManager"
-                    / "menubar.log"
-                ),
-                "StandardErrorPath": str(
-                    Path.home()
-                    / "Library"
-                    / "Logs"
-                    / "DisplayLayoutManager"
-                    / "menubar-error.log"
-                ),
+                "StandardOutPath": str(log_dir / "menubar.log"),
+                "StandardErrorPath": str(log_dir / "menubar-error.log"),
             }
 
-            # plist ファイルを書き込み
-            with open(self.plist_path, "wb") as f:
-                plistlib.dump(plist_data, f)
-
-            # ファイル権限を設定
-            os.chmod(self.plist_path, 0o644)
+            # plist ファイルをアトミックに書き込み
+            # （一時ファイルに書いてから rename することで、
+            #   書き込み途中の plist を launchctl が読むことを防ぐ）
+            cache_key = (
+                tuple(program_args),
+                plist_data["StandardOutPath"],
+                plist_data["StandardErrorPath"],
+            )
+            data = self._plist_bytes_cache.get(cache_key)
+            if data is None:
+                data = plistlib.dumps(plist_data)
+                self._plist_bytes_cache[cache_key] = data
+
+            # 既存の plist と内容が同一ならディスク書き込みだけ省略する
+            # （launchctl への登録は省略しない：前回の有効化が bootstrap で
+            #   失敗していたり、ジョブが bootout されていたりしても、
+            #   plist はディスク上に残ったままになり得るため）
+            try:
+                unchanged = self.plist_path.read_bytes() == data
+            except OSError:
+                unchanged = False
+
+            if not unchanged:
+                tmp_path = self.plist_path.with_suffix(".plist.tmp")
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, data)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, self.plist_path)
 
             # launchctl に登録
-            subprocess.run(
-                ["launchctl", "load", str(self.plist_path)],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            # モダンな bootstrap サブコマンドを使用（load より低レイテンシで冪等）
+            try:
+                subprocess.run(
+                    [
+                        "launchctl",
+                        "bootstrap",
+                        f"gui/{os.getuid()}",
+                        str(self.plist_path),
+                    ],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            except subprocess.CalledProcessError:
+                # 古い macOS では bootstrap が使えないため legacy load にフォールバック
+                subprocess.run(
+                    ["launchctl", "load", str(self.plist_path)],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
 
             print(f"✓ 自動起動を有効化しました: {self.plist_path}")
 
         except subprocess.CalledProcessError as e:
-            raise Exception(f"launchctl の実行に失敗しました: {e.stderr}")
-        except Exception as e:
-            raise Exception(f"自動起動の有効化に失敗しました: {e}")
+            raise AutoLaunchError(f"launchctl の実行に失敗しました: {e.stderr}") from e
+        except OSError as e:
+            raise AutoLaunchError(f"自動起動の有効化に失敗しました: {e}") from e
 
     def disable(self):
         """
         自動起動を無効化
 
         Raises:
-            Exception: 無効化に失敗した場合
+            AutoLaunchError: 無効化に失敗した場合
         """
+        import subprocess
+
         try:
             if not self.plist_path.exists():
                 print("自動起動は既に無効化されています")
@@ -110,60 +162,86 @@ class AutoLaunchManager:
             # launchctl から削除
             try:
                 subprocess.run(
-                    ["launchctl", "unload", str(self.plist_path)],
+                    [
+                        "launchctl",
+                        "bootout",
+                        f"gui/{os.getuid()}/com.eijikominami.display-layout-manager",
+                    ],
                     check=True,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                 )
             except subprocess.CalledProcessError:
-                # unload が失敗しても続行（既に unload されている可能性）
-                pass
+                # bootout が失敗した場合は legacy unload を試す
+                # （どちらも失敗しても続行：既に登録解除されている可能性）
+                try:
+                    subprocess.run(
+                        ["launchctl", "unload", str(self.plist_path)],
+                        check=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                    )
+                except subprocess.CalledProcessError:
+                    pass
 
             # plist ファイルを削除
             self.plist_path.unlink()
 
             print(f"✓ 自動起動を無効化しました: {self.plist_path}")
 
-        except Exception as e:
-            raise Exception(f"自動起動の無効化に失敗しました: {e}")
+        except OSError as e:
+            raise AutoLaunchError(f"自動起動の無効化に失敗しました: {e}") from e
 
     def _find_executable(self) -> str:
         """
         display-layout-menubar の実行ファイルパスを検索
 
+        検索結果はインスタンスにキャッシュされ、2回目以降の呼び出しでは
+        PATH 検索やファイルの stat を行わない。
+
         Returns:
             str: 実行ファイルのパス
         """
-        # which コマンドで検索
-        try:
-            result = subprocess.run(
-                ["which", "display-layout-menubar"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            pass
+        # キャッシュ済みの結果を返す
+        if self._executable_path is not None:
+            return self._executable_path
+
+        self._executable_path = self._resolve_executable()
+        return self._executable_path
+
+    def _resolve_executable(self) -> str:
+        """実行ファイルパスの実際の解決処理"""
+        import shutil
+        import sys
+
+        # venv / インストール先にあるスクリプトを最初に確認
+        # （sys.executable の隣を 1 回 stat するだけで済み、
+        #   PATH 全体の走査より安い）
+        venv_candidate = Path(sys.executable).parent / "display-layout-menubar"
+        if os.path.isfile(venv_candidate):
+            return str(venv_candidate)
+
+        # PATH から検索（shutil.which はプロセス内で完結する）
+        which_result = shutil.which("display-layout-menubar")
+        if which_result:
+            return which_result
 
         # 検索パス
         search_paths = [
             "/opt/homebrew/bin/display-layout-menubar",  # Apple Silicon
             "/usr/local/bin/display-layout-menubar",  # Intel Mac
-            str(
-                Path.home() / ".local" / "bin" / "display-layout-menubar"
-            ),  # pip --user
+            str(self._home / ".local" / "bin" / "display-layout-menubar"),  # pip --user
         ]
 
-        # 検索パスから探す
+        # 検索パスから探す（isfile は stat 1回で存在と種別を同時に判定する）
         for path in search_paths:
-            if Path(path).exists():
+            if os.path.isfile(path):
                 return path
 
         # 開発中の場合：現在のスクリプトを使用
         # python3 -m src.display_layout_manager.menubar として実行
-        import sys
-
         python_executable = sys.executable
         module_path = Path(__file__).parent / "menubar.py"
         if module_path.exists():
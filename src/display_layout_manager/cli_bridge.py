@@ -5,13 +5,25 @@ Display Layout Manager - CLI Bridge
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
-from .command_executor import CommandExecutor
-from .config_manager import ConfigManager
-from .display_manager import DisplayManager
-from .layout_saver import LayoutSaver
-from .pattern_matcher import PatternMatcher
+# 共通エラーメッセージの定数（呼び出しごとの文字列組み立てを抑える）
+_ERR_CONFIG_LOAD = "設定ファイルの読み込みに失敗しました"
+_ERR_DISPLAY_DETECTION = "ディスプレイ情報の取得に失敗しました"
+_ERR_UNEXPECTED = "予期しないエラーが発生しました"
+
+# エラーサマリーに含める検証エラーの最大数
+# （検証エラーが数百件ある設定でも巨大な文字列を組み立てない）
+_MAX_ERRORS_IN_SUMMARY = 3
+
+
+def _summarize_errors(errors) -> str:
+    """エラーリストを先頭数件に絞って要約する"""
+    summary = "; ".join(errors[:_MAX_ERRORS_IN_SUMMARY])
+    if len(errors) > _MAX_ERRORS_IN_SUMMARY:
+        summary += f" …（他 {len(errors) - _MAX_ERRORS_IN_SUMMARY} 件）"
+    return summary
 
 
 @dataclass
@@ -25,7 +37,12 @@ class ActionResult:
 
 
 class CLIBridge:
-    """CLI コンポーネントとの連携クラス"""
+    """CLI コンポーネントとの連携クラス
+
+    各 CLI コンポーネントは初回アクセス時に生成される（遅延初期化）。
+    --help / --version のようなメタデータ系の起動時に
+    不要なモジュールインポートを避けるため。
+    """
 
     def __init__(self, verbose: bool = False):
         """
@@ -35,11 +52,41 @@ class CLIBridge:
             verbose: 詳細ログ出力フラグ
         """
         self.verbose = verbose
-        self.display_manager = DisplayManager(verbose=verbose)
-        self.pattern_matcher = PatternMatcher(verbose=verbose)
-        self.layout_saver = LayoutSaver(verbose=verbose)
-        self.command_executor = CommandExecutor(verbose=verbose)
-        self.config_manager = ConfigManager(verbose=verbose)
+
+    @cached_property
+    def display_manager(self):
+        """DisplayManager（初回アクセス時に生成）"""
+        from .display_manager import DisplayManager
+
+        return DisplayManager(verbose=self.verbose)
+
+    @cached_property
+    def pattern_matcher(self):
+        """PatternMatcher（初回アクセス時に生成）"""
+        from .pattern_matcher import PatternMatcher
+
+        return PatternMatcher(verbose=self.verbose)
+
+    @cached_property
+    def layout_saver(self):
+        """LayoutSaver（初回アクセス時に生成）"""
+        from .layout_saver import LayoutSaver
+
+        return LayoutSaver(verbose=self.verbose)
+
+    @cached_property
+    def command_executor(self):
+        """CommandExecutor（初回アクセス時に生成）"""
+        from .command_executor import CommandExecutor
+
+        return CommandExecutor(verbose=self.verbose)
+
+    @cached_property
+    def config_manager(self):
+        """ConfigManager（初回アクセス時に生成）"""
+        from .config_manager import ConfigManager
+
+        return ConfigManager(verbose=self.verbose)
 
     def execute_apply_layout(self) -> ActionResult:
         """
@@ -55,7 +102,7 @@ class CLIBridge:
             if not success:
                 return ActionResult(
                     success=False,
-                    error_message=f"設定ファイルの読み込みに失敗しました: {', '.join(errors)}",
+                    error_message=f"{_ERR_CONFIG_LOAD}: {_summarize_errors(errors)}",
                 )
 
             # 現在のディスプレイ構成を取得
@@ -63,7 +110,7 @@ class CLIBridge:
             if not success:
                 return ActionResult(
                     success=False,
-                    error_message=f"ディスプレイ情報の取得に失敗しました: {error}",
+                    error_message=f"{_ERR_DISPLAY_DETECTION}: {error}",
                 )
 
             # パターンマッチング
@@ -97,7 +144,7 @@ class CLIBridge:
 
         except Exception as e:
             return ActionResult(
-                success=False, error_message=f"予期しないエラーが発生しました: {str(e)}"
+                success=False, error_message=f"{_ERR_UNEXPECTED}: {str(e)}"
             )
 
     def execute_save_current(self) -> ActionResult:
@@ -127,7 +174,7 @@ class CLIBridge:
 
         except Exception as e:
             return ActionResult(
-                success=False, error_message=f"予期しないエラーが発生しました: {str(e)}"
+                success=False, error_message=f"{_ERR_UNEXPECTED}: {str(e)}"
             )
 
     def get_current_displays(self) -> ActionResult:
@@ -142,7 +189,7 @@ class CLIBridge:
             if not success:
                 return ActionResult(
                     success=False,
-                    error_message=f"ディスプレイ情報の取得に失敗しました: {error}",
+                    error_message=f"{_ERR_DISPLAY_DETECTION}: {error}",
                 )
 
             display_info = (
@@ -155,5 +202,5 @@ class CLIBridge:
 
         except Exception as e:
             return ActionResult(
-                success=False, error_message=f"予期しないエラーが発生しました: {str(e)}"
+                success=False, error_message=f"{_ERR_UNEXPECTED}: {str(e)}"
             )
@@ -4,12 +4,13 @@ displayplacerコマンドの実行と結果処理を管理
 """
 
 import shlex
+import shutil
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
-from .config_manager import ConfigPattern
+from .config_manager import _DP_COMMAND_RE, ConfigPattern
 
 
 @dataclass
@@ -41,6 +42,7 @@ class CommandExecutor:
     def __init__(self, verbose: bool = False, dry_run: bool = False):
         self.verbose = verbose
         self.dry_run = dry_run
+        self._displayplacer_available: Optional[Tuple[bool, str]] = None
 
     def _log(self, message: str) -> None:
         """ログ出力（詳細モード時のみ）"""
@@ -60,7 +62,7 @@ class CommandExecutor:
         if not command:
             return False, "コマンドが空です"
 
-        if not command.strip().startswith("displayplacer"):
+        if _DP_COMMAND_RE.match(command) is None:
             return False, "コマンドは 'displayplacer' で開始する必要があります"
 
         # 基本的な構文チェック
@@ -73,7 +75,7 @@ class CommandExecutor:
         return True, ""
 
     def _execute_command(
-        self, command: str, timeout: int = 60
+        self, command: str, timeout: int = 60, argv: Optional[Sequence[str]] = None
     ) -> Tuple[bool, str, str, int]:
         """
         実際のコマンド実行
@@ -81,6 +83,7 @@ class CommandExecutor:
         Args:
             command: 実行するコマンド
             timeout: タイムアウト秒数
+            argv: 解析済みの引数リスト（省略時は command を解析）
 
         Returns:
             Tuple[bool, str, str, int]: (成功フラグ, stdout, stderr, 終了コード)
@@ -88,14 +91,16 @@ class CommandExecutor:
         try:
             self._log(f"コマンド実行開始: {command[:50]}...")
 
-            # コマンドをシェル経由で実行
-            result = subprocess.run(
-                command, shell=True, capture_output=True, text=True, timeout=timeout
-            )
+            # シェルを経由せず、引数リストとして直接実行
+            # （シェルの fork を省き、シェルインジェクションも防ぐ）
+            # 出力はバイナリで受け取り、終了後に一度だけデコードする
+            if argv is None:
+                argv = shlex.split(command)
+            result = subprocess.run(list(argv), capture_output=True, timeout=timeout)
 
             success = result.returncode == 0
-            stdout = result.stdout.strip()
-            stderr = result.stderr.strip()
+            stdout = result.stdout.decode("utf-8", "replace").strip()
+            stderr = result.stderr.decode("utf-8", "replace").strip()
 
             if success:
                 self._log(f"コマンド実行成功 (終了コード: {result.returncode})")
@@ -130,19 +135,22 @@ class CommandExecutor:
         self._log(f"パターン '{pattern.name}' の実行を開始")
 
         # コマンドの検証
-        is_valid, validation_error = self._validate_command(pattern.command)
-        if not is_valid:
-            self._log(f"コマンド検証エラー: {validation_error}")
-            return ExecutionResult(
-                success=False,
-                command=pattern.command,
-                pattern_name=pattern.name,
-                stdout="",
-                stderr=validation_error,
-                return_code=-1,
-                execution_time=execution_time,
-                dry_run=self.dry_run,
-            )
+        # ConfigPattern は構築時に解析・検証済みなので argv があれば再検証しない
+        pattern_argv = getattr(pattern, "argv", None)
+        if pattern_argv is None:
+            is_valid, validation_error = self._validate_command(pattern.command)
+            if not is_valid:
+                self._log(f"コマンド検証エラー: {validation_error}")
+                return ExecutionResult(
+                    success=False,
+                    command=pattern.command,
+                    pattern_name=pattern.name,
+                    stdout="",
+                    stderr=validation_error,
+                    return_code=-1,
+                    execution_time=execution_time,
+                    dry_run=self.dry_run,
+                )
 
         # ドライランモードの場合
         if self.dry_run:
@@ -162,7 +170,9 @@ class CommandExecutor:
             )
 
         # 実際のコマンド実行
-        success, stdout, stderr, return_code = self._execute_command(pattern.command)
+        success, stdout, stderr, return_code = self._execute_command(
+            pattern.command, argv=pattern_argv
+        )
 
         result = ExecutionResult(
             success=success,
@@ -216,40 +226,62 @@ class CommandExecutor:
         Returns:
             str: 詳細ログ
         """
-        log_lines = []
+        return "\n".join(self._iter_log_lines(result))
 
-        log_lines.append(
-            f"実行時刻: {result.execution_time.strftime('%Y-%m-%d %H:%M:%S')}"
-        )
-        log_lines.append(f"パターン名: {result.pattern_name}")
-        log_lines.append(f"ドライラン: {'はい' if result.dry_run else 'いいえ'}")
-        log_lines.append(f"実行結果: {'成功' if result.success else '失敗'}")
+    def _iter_log_lines(self, result: ExecutionResult):
+        """実行結果ログの各行を生成するジェネレータ
+
+        中間リストを作らず "\\n".join に直接流し込むことで、
+        大きなコマンド出力でもメモリを二重に確保しない。
+        """
+        yield f"実行時刻: {result.execution_time.strftime('%Y-%m-%d %H:%M:%S')}"
+        yield f"パターン名: {result.pattern_name}"
+        yield f"ドライラン: {'はい' if result.dry_run else 'いいえ'}"
+        yield f"実行結果: {'成功' if result.success else '失敗'}"
 
         if not result.dry_run:
-            log_lines.append(f"終了コード: {result.return_code}")
+            yield f"終了コード: {result.return_code}"
 
-        log_lines.append(f"実行コマンド:")
-        log_lines.append(f"  {result.command}")
+        yield "実行コマンド:"
+        yield f"  {result.command}"
 
         if result.stdout:
-            log_lines.append(f"標準出力:")
-            for line in result.stdout.split("\n"):
-                log_lines.append(f"  {line}")
+            yield "標準出力:"
+            for line in result.stdout.splitlines():
+                yield f"  {line}"
 
         if result.stderr:
-            log_lines.append(f"標準エラー:")
-            for line in result.stderr.split("\n"):
-                log_lines.append(f"  {line}")
-
-        return "\n".join(log_lines)
+            yield "標準エラー:"
+            for line in result.stderr.splitlines():
+                yield f"  {line}"
 
     def validate_displayplacer_available(self) -> Tuple[bool, str]:
         """
         displayplacerコマンドが利用可能かチェック
 
+        結果はプロセス生存中キャッシュされる（バイナリの有無は
+        呼び出しのたびに変わるものではないため）。
+
         Returns:
             Tuple[bool, str]: (利用可能フラグ, エラーメッセージ)
         """
+        if self._displayplacer_available is not None:
+            return self._displayplacer_available
+
+        self._displayplacer_available = self._check_displayplacer_available()
+        return self._displayplacer_available
+
+    def _check_displayplacer_available(self) -> Tuple[bool, str]:
+        """displayplacerコマンドの実際の確認処理
+
+        まず shutil.which で PATH を走査する（fork 不要）。
+        見つかればコマンドを起動せずに利用可能と判断する。
+        """
+        if shutil.which("displayplacer") is not None:
+            return True, ""
+
+        # PATH に無い場合のみ、従来どおり実行して確認する
+        # （シェル初期化で PATH が変わる環境へのフォールバック）
         try:
             result = subprocess.run(
                 ["displayplacer", "--version"],
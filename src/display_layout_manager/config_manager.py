@@ -3,13 +3,34 @@
 JSON形式の設定ファイルの読み込み、検証、デフォルト作成を管理
 """
 
+import hashlib
 import json
 import os
+import re
+import shlex
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+# orjson があれば C 実装のパーサを使う（任意依存・無ければ標準 json）
+try:
+    import orjson
+
+    def _parse_json_bytes(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _parse_json_bytes(data: bytes) -> Any:
+        return json.loads(data)
+
+
+# 'displayplacer' プレフィックス検証用のコンパイル済みパターン
+# （strip() による文字列コピーを作らず、先頭だけを C レベルで走査する）
+_DP_COMMAND_RE = re.compile(r"\s*displayplacer(?:\s|$)")
+
 
 @dataclass
 class ConfigPattern:
@@ -28,9 +49,16 @@ class ConfigPattern:
             raise ValueError("screen_ids は必須です")
         if not self.command:
             raise ValueError("command は必須です")
-        if not self.command.strip().startswith("displayplacer"):
+        if _DP_COMMAND_RE.match(self.command) is None:
             raise ValueError("command は 'displayplacer' で開始する必要があります")
 
+        # コマンドを読み込み時に一度だけ解析しておく
+        # （実行のたびに shlex.split し直すコストと再検証を省く）
+        try:
+            self.argv: Tuple[str, ...] = tuple(shlex.split(self.command))
+        except ValueError as e:
+            raise ValueError(f"command の構文エラー: {e}")
+
 
 @dataclass
 class Configuration:
@@ -47,12 +75,66 @@ class Configuration:
             raise ValueError("patterns は必須です")
 
 
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """デフォルト設定ファイルパス（初回の呼び出しで一度だけ構築）"""
+    return (
+        Path.home()
+        / "Library"
+        / "Application Support"
+        / "DisplayLayoutManager"
+        / "config.json"
+    )
+
+
+def _validate_name_field(value: Any) -> List[str]:
+    """'name' フィールドの検証"""
+    if not isinstance(value, str):
+        return ["'name' は文字列である必要があります"]
+    return []
+
+
+def _validate_screen_ids_field(value: Any) -> List[str]:
+    """'screen_ids' フィールドの検証"""
+    if not isinstance(value, list):
+        return ["'screen_ids' は配列である必要があります"]
+    if len(value) == 0:
+        return ["'screen_ids' は空にできません"]
+    if not all(isinstance(sid, str) for sid in value):
+        return ["'screen_ids' の全要素は文字列である必要があります"]
+    return []
+
+
+def _validate_command_field(value: Any) -> List[str]:
+    """'command' フィールドの検証"""
+    if not isinstance(value, str):
+        return ["'command' は文字列である必要があります"]
+    if _DP_COMMAND_RE.match(value) is None:
+        return ["'command' は 'displayplacer' で開始する必要があります"]
+    return []
+
+
+# パターン必須フィールドの検証ルールテーブル
+# （フィールドごとの if/elif カスケードを一度だけ構築した表引きに置き換える）
+_PATTERN_FIELD_VALIDATORS = {
+    "name": _validate_name_field,
+    "screen_ids": _validate_screen_ids_field,
+    "command": _validate_command_field,
+}
+
+
 class ConfigManager:
     """設定ファイル管理クラス"""
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self._config: Optional[Configuration] = None
+        self._pattern_by_name: Dict[str, ConfigPattern] = {}
+        self._patterns_tuple: Tuple[ConfigPattern, ...] = ()
+        # 読み込み結果のキャッシュ
+        # パスごとに (mtime_ns, サイズ, inode) のキーと内容ハッシュ、
+        # 解析結果を保持し、ファイルが変わっていなければ JSON の再解析を省く
+        self._load_cache: Dict[Path, Tuple[Tuple[int, int, int], bytes, Any]] = {}
 
     def _log(self, message: str) -> None:
         """ログ出力（詳細モード時のみ）"""
@@ -61,13 +143,7 @@ class ConfigManager:
 
     def get_default_config_path(self) -> Path:
         """デフォルト設定ファイルパスを取得"""
-        return (
-            Path.home()
-            / "Library"
-            / "Application Support"
-            / "DisplayLayoutManager"
-            / "config.json"
-        )
+        return _default_config_path()
 
     def get_config_path(self, config_arg: Optional[Path] = None) -> Path:
         """設定ファイルパスを決定（優先順位に従って）"""
@@ -157,37 +233,15 @@ class ConfigManager:
                 )
                 continue
 
-            # パターンの必須フィールド確認
-            required_fields = ["name", "screen_ids", "command"]
-            for field in required_fields:
+            # パターンの必須フィールド確認（ルールテーブルによる表引き）
+            for field, validator in _PATTERN_FIELD_VALIDATORS.items():
                 if field not in pattern:
                     errors.append(
                         f"パターン {i+1}: 必須フィールド '{field}' が見つかりません"
                     )
-                elif field == "name" and not isinstance(pattern[field], str):
-                    errors.append(
-                        f"パターン {i+1}: '{field}' は文字列である必要があります"
-                    )
-                elif field == "screen_ids":
-                    if not isinstance(pattern[field], list):
-                        errors.append(
-                            f"パターン {i+1}: '{field}' は配列である必要があります"
-                        )
-                    elif len(pattern[field]) == 0:
-                        errors.append(f"パターン {i+1}: '{field}' は空にできません")
-                    elif not all(isinstance(sid, str) for sid in pattern[field]):
-                        errors.append(
-                            f"パターン {i+1}: '{field}' の全要素は文字列である必要があります"
-                        )
-                elif field == "command":
-                    if not isinstance(pattern[field], str):
-                        errors.append(
-                            f"パターン {i+1}: '{field}' は文字列である必要があります"
-                        )
-                    elif not pattern[field].strip().startswith("displayplacer"):
-                        errors.append(
-                            f"パターン {i+1}: '{field}' は 'displayplacer' で開始する必要があります"
-                        )
+                    continue
+                for message in validator(pattern[field]):
+                    errors.append(f"パターン {i+1}: {message}")
 
             # オプションフィールドの検証
             if "description" in pattern and not isinstance(pattern["description"], str):
@@ -208,14 +262,35 @@ class ConfigManager:
         """
         self._log(f"設定ファイルを読み込み中: {config_path}")
 
-        # ファイル存在確認
-        if not config_path.exists():
+        # ファイル存在確認（stat 1回で存在確認と変更検出キーを兼ねる）
+        try:
+            st = os.stat(config_path)
+        except FileNotFoundError:
             return False, None, [f"設定ファイルが見つかりません: {config_path}"]
+        except OSError as e:
+            return False, None, [f"設定ファイル読み込みエラー: {e}"]
+
+        # 前回読み込みからファイルが変わっていなければ解析をスキップ
+        stat_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._load_cache.get(config_path)
+        if cached is not None and cached[0] == stat_key:
+            self._log("設定ファイルは未変更のためキャッシュを使用")
+            return cached[2]
 
         try:
             # JSONファイルの読み込み
-            with open(config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            with open(config_path, "rb") as f:
+                raw_data = f.read()
+
+            # mtime だけ変わって内容が同一の場合（touch や同内容の再保存）は
+            # ハッシュ比較で再解析をスキップする
+            digest = hashlib.blake2b(raw_data, digest_size=16).digest()
+            if cached is not None and cached[1] == digest:
+                self._load_cache[config_path] = (stat_key, digest, cached[2])
+                self._log("設定ファイルの内容は未変更のためキャッシュを使用")
+                return cached[2]
+
+            config_data = _parse_json_bytes(raw_data)
 
             self._log("JSON解析完了")
 
@@ -238,7 +313,9 @@ class ConfigManager:
             config = Configuration(version=config_data["version"], patterns=patterns)
 
             self._log(f"設定ファイル読み込み完了: {len(patterns)}個のパターン")
-            return True, config, []
+            result = (True, config, [])
+            self._load_cache[config_path] = (stat_key, digest, result)
+            return result
 
         except json.JSONDecodeError as e:
             error_msg = f"JSON構文エラー: {e.msg} (行 {e.lineno}, 列 {e.colno})"
@@ -279,19 +356,17 @@ class ConfigManager:
         else:
             return self.load_config(config_path)
 
-    def get_patterns(self) -> List[ConfigPattern]:
-        """現在の設定パターンを取得"""
-        if self._config is None:
-            return []
-        return self._config.patterns
+    def get_patterns(self) -> Tuple[ConfigPattern, ...]:
+        """現在の設定パターンを取得（読み取り専用スナップショット）"""
+        return self._patterns_tuple
 
     def get_pattern_by_name(self, name: str) -> Optional[ConfigPattern]:
-        """名前でパターンを検索"""
-        for pattern in self.get_patterns():
-            if pattern.name == name:
-                return pattern
-        return None
+        """名前でパターンを検索（名前インデックスによる O(1) 検索）"""
+        return self._pattern_by_name.get(name)
 
     def set_config(self, config: Configuration) -> None:
         """設定オブジェクトを設定"""
         self._config = config
+        # 名前検索用のインデックスと読み取り専用スナップショットを一度だけ構築
+        self._pattern_by_name = {p.name: p for p in config.patterns}
+        self._patterns_tuple = tuple(config.patterns)
@@ -3,11 +3,16 @@
 必要な外部ツールの存在確認とインストールを管理
 """
 
+import os
+import re
 import shutil
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
+# GNU grep 判定用のコンパイル済みパターン（バイト列のまま照合する）
+_GNU_GREP_RE = re.compile(rb"GNU grep")
+
 
 class DependencyManager:
     """依存関係管理クラス"""
@@ -20,15 +25,32 @@ class DependencyManager:
         if self.verbose:
             print(f"[依存関係] {message}")
 
-    def _run_command(self, command: list, timeout: int = 30) -> Tuple[bool, str, str]:
+    def _run_command(
+        self, command: list, timeout: int = 30, capture: bool = True
+    ) -> Tuple[bool, str, str]:
         """
         コマンドを実行し、結果を返す
 
+        Args:
+            command: 実行するコマンド
+            timeout: タイムアウト秒数
+            capture: 出力を取得するか（終了コードだけ見る呼び出しでは
+                False にするとパイプ生成とデコードを省ける）
+
         Returns:
             Tuple[bool, str, str]: (成功フラグ, stdout, stderr)
         """
         try:
             self._log(f"コマンド実行: {' '.join(command)}")
+            if not capture:
+                result = subprocess.run(
+                    command,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=timeout,
+                )
+                return result.returncode == 0, "", ""
+
             result = subprocess.run(
                 command, capture_output=True, text=True, timeout=timeout
             )
@@ -53,6 +75,20 @@ class DependencyManager:
             self._log(f"コマンド実行エラー: {e}")
             return False, "", str(e)
 
+    def _is_gnu_grep(self, grep_path: str) -> bool:
+        """指定された grep が GNU grep かどうかを判定
+
+        --version の出力をバイト列のまま照合し、UTF-8 デコードを省く。
+        """
+        try:
+            result = subprocess.run(
+                [grep_path, "--version"], capture_output=True, timeout=30
+            )
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+        return result.returncode == 0 and _GNU_GREP_RE.search(result.stdout) is not None
+
     def check_homebrew(self) -> bool:
         """Homebrewがインストールされているかチェック"""
         self._log("Homebrew の存在確認中...")
@@ -63,7 +99,11 @@ class DependencyManager:
             return False
 
         # brewコマンドの動作確認
-        success, stdout, stderr = self._run_command(["brew", "--version"])
+        # （バージョン文字列は詳細モードのログでしか使わないため、
+        #   非詳細モードでは出力を捨てて確認だけ行う）
+        success, stdout, stderr = self._run_command(
+            ["brew", "--version"], capture=self.verbose
+        )
         if success:
             self._log(
                 f"Homebrew 確認完了: {stdout.split()[1] if stdout.split() else 'バージョン不明'}"
@@ -82,8 +122,10 @@ class DependencyManager:
             self._log("displayplacer が見つかりません")
             return False
 
-        # displayplacerコマンドの動作確認
-        success, stdout, stderr = self._run_command(["displayplacer", "--version"])
+        # displayplacerコマンドの動作確認（出力は確認には不要）
+        success, stdout, stderr = self._run_command(
+            ["displayplacer", "--version"], capture=self.verbose
+        )
         if success:
             self._log(f"displayplacer 確認完了")
             return True
@@ -98,35 +140,30 @@ class DependencyManager:
                 return False
 
     def check_gnu_grep(self) -> bool:
-        """GNU grepがインストールされているかチェック"""
-        self._log("GNU grep の存在確認中...")
+        """GNU grepがインストールされているかチェック
 
-        # HomebrewのGNU grepを確認（ggrep, gegrep, gfgrep）
-        homebrew_grep_commands = [
-            "ggrep",  # GNU grep
-            "gegrep",  # GNU egrep
-            "gfgrep",  # GNU fgrep
-        ]
+        fork を伴う --version 実行は最初に見つかった候補1つ
+        （見つからない場合はシステム grep の判定1回）に抑える。
+        """
+        self._log("GNU grep の存在確認中...")
 
-        for grep_cmd in homebrew_grep_commands:
-            if shutil.which(grep_cmd):
-                success, stdout, stderr = self._run_command([grep_cmd, "--version"])
-                if success and "GNU grep" in stdout:
-                    self._log(f"GNU grep 確認完了: {grep_cmd}")
-                    return True
+        # HomebrewのGNU grep（ggrep）を PATH から確認
+        # （shutil.which はプロセス内で完結し fork しない）
+        grep_cmd = shutil.which("ggrep")
+        if grep_cmd and self._is_gnu_grep(grep_cmd):
+            self._log(f"GNU grep 確認完了: {grep_cmd}")
+            return True
 
-        # Homebrewのインストールパスを直接確認
+        # Homebrewのインストールパスを直接確認（stat 1回ずつ）
         homebrew_grep_paths = [
             "/opt/homebrew/opt/grep/bin/ggrep",  # Apple Silicon Mac
             "/usr/local/opt/grep/bin/ggrep",  # Intel Mac
         ]
 
         for grep_path in homebrew_grep_paths:
-            if Path(grep_path).exists():
-                success, stdout, stderr = self._run_command([grep_path, "--version"])
-                if success and "GNU grep" in stdout:
-                    self._log(f"GNU grep 確認完了: {grep_path}")
-                    return True
+            if os.path.isfile(grep_path) and self._is_gnu_grep(grep_path):
+                self._log(f"GNU grep 確認完了: {grep_path}")
+                return True
 
         # システムのgrepコマンドの存在確認
         grep_path = shutil.which("grep")
@@ -135,8 +172,7 @@ class DependencyManager:
             return False
 
         # GNU grepかどうか確認
-        success, stdout, stderr = self._run_command(["grep", "--version"])
-        if success and "GNU grep" in stdout:
+        if self._is_gnu_grep(grep_path):
             self._log("GNU grep 確認完了")
             return True
         else:
@@ -228,11 +264,17 @@ class DependencyManager:
         """
         print("依存関係をチェック中...")
 
-        status = {
-            "homebrew": self.check_homebrew(),
-            "displayplacer": self.check_displayplacer(),
-            "gnu_grep": self.check_gnu_grep(),
+        # 3つのチェックは互いに独立で、それぞれ subprocess 待ちが大半を占める。
+        # 並列に実行すると所要時間は最も遅いチェック1つ分に収まる
+        # （インストール処理は brew の同時実行を避けるため直列のまま）
+        checks = {
+            "homebrew": self.check_homebrew,
+            "displayplacer": self.check_displayplacer,
+            "gnu_grep": self.check_gnu_grep,
         }
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {tool: executor.submit(check) for tool, check in checks.items()}
+            status = {tool: future.result() for tool, future in futures.items()}
 
         # 結果表示
         for tool, available in status.items():
@@ -243,9 +285,13 @@ class DependencyManager:
         return all_available, status
 
     def install_missing_dependencies(self, status: dict) -> bool:
-        """不足している依存関係をインストール"""
-        success = True
+        """不足している依存関係をインストール
 
+        複数のツールが不足している場合は 1 回の brew install にまとめて
+        実行する（brew の起動と formula 解決のオーバーヘッドを 1 回分に
+        抑えるため）。単一ツールのインストールが必要な呼び出し元には
+        install_displayplacer / install_gnu_grep が引き続き使える。
+        """
         if not status["homebrew"]:
             print("\nHomebrew が見つかりません。")
             print("以下のコマンドでインストールしてください：")
@@ -259,17 +305,34 @@ class DependencyManager:
             print("2. 再度このプログラムを実行してください")
             return False
 
+        to_install = []
         if not status["displayplacer"]:
-            print("\ndisplayplacer をインストール中...")
-            if not self.install_displayplacer():
-                success = False
-
+            to_install.append("jakehilborn/jakehilborn/displayplacer")
         if not status["gnu_grep"]:
-            print("\nGNU grep をインストール中...")
-            if not self.install_gnu_grep():
-                success = False
+            to_install.append("grep")
+
+        if not to_install:
+            return True
+
+        print(f"\n不足ツールをインストール中: {', '.join(to_install)}")
+        success, stdout, stderr = self._run_command(
+            ["brew", "install", *to_install], timeout=240
+        )
+
+        if success:
+            print("インストールが完了しました")
+            if not status["gnu_grep"]:
+                print(
+                    "注意: Homebrew の GNU grep は 'ggrep' コマンドとしてインストールされます"
+                )
+            return True
 
-        return success
+        print(f"インストールに失敗しました: {stderr}")
+        if not status["displayplacer"]:
+            self._print_displayplacer_troubleshooting()
+        if not status["gnu_grep"]:
+            self._print_gnu_grep_troubleshooting()
+        return False
 
     def ensure_dependencies(self) -> bool:
         """
@@ -4,11 +4,45 @@ displayplacerコマンドを使用してディスプレイ情報を取得・管
 """
 
 import re
+import shutil
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
+# google-re2 があれば線形時間保証の DFA エンジンを使う
+# （任意依存・無ければ標準 re。API は re と互換）
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Persistent Screen IDを抽出する正規表現（モジュール読み込み時に一度だけコンパイル）
+# 例: "Persistent screen id: 37D8832A-2D66-02CA-B9F7-8F30A301B230"
+# 大文字・小文字は文字クラスに直接書き、IGNORECASE の
+# ケースフォールディング処理を正規表現エンジンに負わせない。
+# キャプチャを UUID の形そのものに固定することで、
+# 抽出と形式検証を 1 回の走査で済ませる（不正な ID はそもそも捕捉されない）
+_SCREEN_ID_RE = _re_engine.compile(
+    r"Persistent screen id:\s*"
+    r"([A-Fa-f0-9]{8}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{12})\b"
+)
+
+
+@lru_cache(maxsize=16)
+def _parse_screen_ids(raw_output: str) -> Tuple[str, ...]:
+    """displayplacer listの出力からScreen IDを抽出（結果はメモ化）
+
+    検証時には取得直後と同じ出力に対して再度呼ばれることが多いため、
+    同一文字列に対する正規表現の再実行を辞書引き1回に置き換える。
+
+    返り値の順序は不定。表示・比較用の正規化（ソート）は
+    DisplayConfiguration.__post_init__ が一手に引き受ける。
+    """
+    # set による一括重複排除で、リストに対する線形のメンバーシップ検査を避ける
+    return tuple(set(_SCREEN_ID_RE.findall(raw_output)))
+
 
 @dataclass
 class DisplayConfiguration:
@@ -30,6 +64,7 @@ class DisplayManager:
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self._current_config: Optional[DisplayConfiguration] = None
+        self._displayplacer_path: Optional[str] = None
 
     def _log(self, message: str) -> None:
         """ログ出力（詳細モード時のみ）"""
@@ -47,13 +82,13 @@ class DisplayManager:
         """
         try:
             self._log(f"コマンド実行: {' '.join(command)}")
-            result = subprocess.run(
-                command, capture_output=True, text=True, timeout=timeout
-            )
+            # 出力はバイナリで受け取り、終了後に一度だけデコードする
+            # （text=True の TextIOWrapper 経由の逐次デコードを省く）
+            result = subprocess.run(command, capture_output=True, timeout=timeout)
 
             success = result.returncode == 0
-            stdout = result.stdout.strip()
-            stderr = result.stderr.strip()
+            stdout = result.stdout.decode("utf-8", "replace").strip()
+            stderr = result.stderr.decode("utf-8", "replace").strip()
 
             if success:
                 self._log(f"コマンド成功: {len(stdout)}文字の出力")
@@ -71,6 +106,17 @@ class DisplayManager:
             self._log(f"コマンド実行エラー: {e}")
             return False, "", str(e)
 
+    def _displayplacer(self) -> str:
+        """displayplacer の絶対パスを取得（初回の which の結果をキャッシュ）
+
+        絶対パスで起動すると子プロセス側の execvp による
+        PATH 走査を省ける。見つからない場合はコマンド名のまま返し、
+        実行時のエラー処理に委ねる。
+        """
+        if self._displayplacer_path is None:
+            self._displayplacer_path = shutil.which("displayplacer") or "displayplacer"
+        return self._displayplacer_path
+
     def extract_screen_ids(self, displayplacer_output: str) -> List[str]:
         """
         displayplacer listの出力からPersistent Screen IDを抽出
@@ -79,23 +125,15 @@ class DisplayManager:
             displayplacer_output: displayplacer listコマンドの出力
 
         Returns:
-            List[str]: 抽出されたScreen IDのリスト
+            List[str]: 抽出されたScreen IDのリスト（順序は不定）
         """
-        screen_ids = []
+        screen_ids = list(_parse_screen_ids(displayplacer_output))
 
-        # Persistent Screen IDを抽出する正規表現
-        # 例: "Persistent screen id: 37D8832A-2D66-02CA-B9F7-8F30A301B230"
-        id_pattern = r"Persistent screen id:\s*([A-F0-9-]+)"
-
-        matches = re.findall(id_pattern, displayplacer_output, re.IGNORECASE)
-
-        for match in matches:
-            screen_id = match.strip()
-            if screen_id and screen_id not in screen_ids:
-                screen_ids.append(screen_id)
+        if self.verbose:
+            for screen_id in screen_ids:
                 self._log(f"Screen ID検出: {screen_id}")
 
-        return sorted(screen_ids)  # 一貫性のためソート
+        return screen_ids
 
     def get_current_displays(self) -> Tuple[bool, Optional[DisplayConfiguration], str]:
         """
@@ -107,7 +145,7 @@ class DisplayManager:
         self._log("現在のディスプレイ構成を取得中...")
 
         # displayplacer listコマンドを実行
-        success, stdout, stderr = self._run_command(["displayplacer", "list"])
+        success, stdout, stderr = self._run_command([self._displayplacer(), "list"])
 
         if not success:
             error_msg = f"displayplacer listコマンドの実行に失敗しました: {stderr}"
@@ -227,10 +265,7 @@ class DisplayManager:
         if len(screen_ids) != len(set(screen_ids)):
             issues.append("重複するScreen IDが検出されました")
 
-        # Screen IDの形式チェック（UUID形式）
-        uuid_pattern = r"^[A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12}$"
-        for screen_id in screen_ids:
-            if not re.match(uuid_pattern, screen_id, re.IGNORECASE):
-                issues.append(f"無効なScreen ID形式: {screen_id}")
+        # Screen IDの形式チェックは抽出パターン自体が UUID 形式を
+        # 要求するため不要（不正な形式の ID は抽出段階で除外される）
 
         return len(issues) == 0, issues
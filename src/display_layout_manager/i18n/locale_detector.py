@@ -6,6 +6,28 @@ Detects system locale and determines the appropriate language for messages.
 
 import locale
 import os
+import sys
+
+__all__ = ["LocaleDetector"]
+
+# Lazily-imported NSLocale class (PyObjC). The import is attempted at most
+# once per process; on non-macOS platforms it is never attempted at all.
+_NSLocale = None
+_NSLocale_tried = False
+
+
+def _ns_locale():
+    """Return Foundation.NSLocale, importing it on first use only."""
+    global _NSLocale, _NSLocale_tried
+    if not _NSLocale_tried:
+        _NSLocale_tried = True
+        try:
+            from Foundation import NSLocale
+
+            _NSLocale = NSLocale
+        except Exception:
+            _NSLocale = None
+    return _NSLocale
 
 
 class LocaleDetector:
@@ -34,18 +56,19 @@ class LocaleDetector:
             return "en"
 
         # macOS: Use NSLocale to get preferred languages (for GUI apps)
-        try:
-            from Foundation import NSLocale
-
-            # Get the list of preferred languages
-            preferred_languages = NSLocale.preferredLanguages()
-            if preferred_languages and len(preferred_languages) > 0:
-                # Check the first preferred language
-                first_lang = preferred_languages[0]
-                if first_lang.startswith("ja"):
-                    return "ja"
-        except Exception:
-            pass
+        if sys.platform == "darwin":
+            NSLocale = _ns_locale()
+            if NSLocale is not None:
+                try:
+                    # Get the list of preferred languages
+                    preferred_languages = NSLocale.preferredLanguages()
+                    if preferred_languages and len(preferred_languages) > 0:
+                        # Check the first preferred language
+                        first_lang = preferred_languages[0]
+                        if first_lang.startswith("ja"):
+                            return "ja"
+                except Exception:
+                    pass
 
         # Use locale module as fallback
         try:
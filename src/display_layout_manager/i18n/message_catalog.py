@@ -4,6 +4,8 @@ Message Catalog
 Contains all user-facing messages in English and Japanese.
 """
 
+from types import MappingProxyType
+
 MESSAGES = {
     "en": {
         # System messages
@@ -166,3 +168,9 @@ MESSAGES = {
         "dry_run_enabled": "ドライランモード: 有効",
     },
 }
+
+# The catalog is never mutated at runtime; expose read-only views so
+# consumers can safely cache references to the per-locale dicts.
+MESSAGES = MappingProxyType(
+    {locale: MappingProxyType(catalog) for locale, catalog in MESSAGES.items()}
+)
@@ -4,11 +4,41 @@ Message Manager
 Manages message retrieval and formatting based on detected locale.
 """
 
-from typing import Any
+import string
+from typing import Any, Callable, Dict
 
 from .locale_detector import LocaleDetector
 from .message_catalog import MESSAGES
 
+# Parses a format template into (literal, field, spec, conversion) tuples
+_parse_template = string.Formatter().parse
+
+
+def _compile_template(template: str) -> "Callable[[Dict[str, Any]], str]":
+    """Pre-parse a format template into a render function.
+
+    str.format re-parses the template on every call; parsing once and
+    rendering from the parsed segments skips that cost for messages
+    emitted repeatedly (per-display lines, log output).
+    """
+    parts = list(_parse_template(template))
+
+    def render(kwargs: Dict[str, Any]) -> str:
+        chunks = []
+        for literal, field, spec, conversion in parts:
+            if literal:
+                chunks.append(literal)
+            if field is not None:
+                value = kwargs[field]
+                if conversion == "s":
+                    value = str(value)
+                elif conversion == "r":
+                    value = repr(value)
+                chunks.append(format(value, spec))
+        return "".join(chunks)
+
+    return render
+
 
 class MessageManager:
     """Message manager for internationalized messages"""
@@ -16,6 +46,14 @@ class MessageManager:
     def __init__(self, locale_detector: LocaleDetector = None):
         self.locale_detector = locale_detector or LocaleDetector()
         self.messages = MESSAGES
+        # Resolve the per-locale catalog once; the locale cannot change
+        # within a process, so get() only needs a single dict lookup.
+        self._primary = (
+            MESSAGES.get(self.locale_detector.get_locale()) or MESSAGES["en"]
+        )
+        self._fallback = MESSAGES["en"]
+        # Render functions compiled lazily per message key
+        self._compiled: Dict[str, Callable[[Dict[str, Any]], str]] = {}
 
     def get(self, key: str, **kwargs: Any) -> str:
         """
@@ -28,20 +66,32 @@ class MessageManager:
         Returns:
             str: Localized message
         """
-        locale = self.locale_detector.get_locale()
-
-        # Get message for current locale
-        message = self.messages.get(locale, {}).get(key)
+        message = self._primary.get(key)
 
         # Fallback to English
         if message is None:
-            message = self.messages.get("en", {}).get(key, key)
+            message = self._fallback.get(key, key)
+
+        # Most messages have no placeholders; return before any
+        # formatting machinery (or try/except setup) is touched.
+        if not kwargs:
+            return message
+
+        return self._format(key, message, kwargs)
 
-        # Format message
-        if kwargs:
+    def _format(self, key: str, message: str, kwargs: Dict[str, Any]) -> str:
+        """Format a message via its cached pre-parsed template.
+
+        Falls back to the raw message on any formatting error.
+        """
+        render = self._compiled.get(key)
+        if render is None:
             try:
-                return message.format(**kwargs)
-            except (KeyError, ValueError):
+                render = _compile_template(message)
+            except ValueError:
                 return message
-
-        return message
+            self._compiled[key] = render
+        try:
+            return render(kwargs)
+        except (KeyError, ValueError, TypeError):
+            return message
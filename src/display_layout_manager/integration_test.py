@@ -64,7 +64,7 @@ class IntegrationTester:
         """依存関係管理のテスト"""
         import time
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             self._log("依存関係管理テスト開始")
@@ -95,13 +95,13 @@ class IntegrationTester:
             )
             message = "依存関係管理テスト成功" if success else "依存関係管理テスト失敗"
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "dependency_management", success, message, details, execution_time
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "dependency_management",
                 False,
@@ -114,7 +114,7 @@ class IntegrationTester:
         """設定ファイル管理のテスト"""
         import time
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             self._log("設定ファイル管理テスト開始")
@@ -171,13 +171,13 @@ class IntegrationTester:
                 else "設定ファイル管理テスト失敗"
             )
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "config_management", test_success, message, details, execution_time
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "config_management",
                 False,
@@ -190,7 +190,7 @@ class IntegrationTester:
         """ディスプレイ検出のテスト"""
         import time
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             self._log("ディスプレイ検出テスト開始")
@@ -228,13 +228,13 @@ class IntegrationTester:
                 else f"ディスプレイ検出テスト失敗: {error}"
             )
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "display_detection", test_success, message, details, execution_time
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "display_detection",
                 False,
@@ -247,7 +247,7 @@ class IntegrationTester:
         """パターンマッチングのテスト"""
         import time
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             self._log("パターンマッチングテスト開始")
@@ -327,13 +327,13 @@ class IntegrationTester:
                 else "パターンマッチングテスト失敗"
             )
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "pattern_matching", test_success, message, details, execution_time
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "pattern_matching",
                 False,
@@ -346,7 +346,7 @@ class IntegrationTester:
         """コマンド実行のテスト（ドライランのみ）"""
         import time
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             self._log("コマンド実行テスト開始")
@@ -398,13 +398,13 @@ class IntegrationTester:
                 "コマンド実行テスト成功" if test_success else "コマンド実行テスト失敗"
             )
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "command_execution", test_success, message, details, execution_time
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "command_execution",
                 False,
@@ -417,7 +417,7 @@ class IntegrationTester:
         """ログシステムのテスト"""
         import time
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             self._log("ログシステムテスト開始")
@@ -455,13 +455,13 @@ class IntegrationTester:
                 "ログシステムテスト成功" if test_success else "ログシステムテスト失敗"
             )
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "logging_system", test_success, message, details, execution_time
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "logging_system",
                 False,
@@ -474,7 +474,7 @@ class IntegrationTester:
         """レイアウト保存機能のテスト"""
         import time
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             self._log("レイアウト保存機能テスト開始")
@@ -519,13 +519,13 @@ displayplacer "id:TEST-ID-1 res:1920x1080 hz:60 color_depth:8 enabled:true scali
                 else "レイアウト保存機能テスト失敗"
             )
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "layout_saver", test_success, message, details, execution_time
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             return TestResult(
                 "layout_saver",
                 False,
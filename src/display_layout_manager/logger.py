@@ -6,17 +6,35 @@ Note: Log files are always written in English (technical records).
       CLI output is internationalized based on system locale.
 """
 
+import atexit
 import json
 import os
+from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from .command_executor import ExecutionResult
-from .display_manager import DisplayConfiguration
 from .i18n import LocaleDetector, MessageManager
-from .pattern_matcher import MatchResult
+
+if TYPE_CHECKING:
+    # 型注釈専用のインポート（実行時には不要）
+    # Logger 単体のインポートで実行系モジュールまで読み込まないようにする
+    from .command_executor import ExecutionResult
+    from .display_manager import DisplayConfiguration
+    from .pattern_matcher import MatchResult
+
+# orjson があれば C 実装のエンコーダを使う（任意依存・無ければ標準 json）
+try:
+    import orjson
+
+    def _encode_log_line(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data) + b"\n"
+
+except ImportError:
+
+    def _encode_log_line(data: Dict[str, Any]) -> bytes:
+        return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 @dataclass
@@ -37,14 +55,25 @@ class LogEntry:
 class Logger:
     """ログ・フィードバック管理クラス"""
 
+    # バッファに溜めてからまとめて書き込むエントリ数
+    # （エントリごとの open/write/close を減らす）
+    _FLUSH_BATCH_SIZE = 16
+
+    # メモリ上に保持するログエントリの上限
+    # （常駐モードで無制限にメモリが増えるのを防ぐ。
+    #   ファイルへの書き込みは上限の影響を受けない）
+    _MAX_LOG_ENTRIES = 1000
+
     def __init__(
         self, verbose: bool = False, log_to_file: bool = True, daemon_mode: bool = False
     ):
         self.verbose = verbose
         self.log_to_file = log_to_file
         self.daemon_mode = daemon_mode
-        self.log_entries = []
+        self.log_entries = deque(maxlen=self._MAX_LOG_ENTRIES)
         self._log_file_path: Optional[Path] = None
+        self._pending_lines = []
+        self._log_fd: Optional[int] = None
 
         # Initialize i18n for CLI output
         self.locale_detector = LocaleDetector()
@@ -52,6 +81,8 @@ class Logger:
 
         if self.log_to_file:
             self._setup_log_file()
+            # プロセス終了時に未書き込み分を確実にフラッシュしてクローズ
+            atexit.register(self.close)
 
     def _setup_log_file(self) -> None:
         """ログファイルのセットアップ"""
@@ -70,18 +101,59 @@ class Logger:
         os.chmod(log_dir, 0o700)
 
     def _write_to_file(self, log_entry: LogEntry) -> None:
-        """ログファイルに書き込み"""
+        """ログファイルへの書き込みをバッファリング
+
+        シリアライズ済みの行をバッファに溜め、一定数たまったら
+        1回の open でまとめて書き込む。ERROR は即時フラッシュする。
+        """
         if not self.log_to_file or not self._log_file_path:
             return
 
+        self._pending_lines.append(_encode_log_line(log_entry.to_dict()))
+
+        if (
+            log_entry.level == "ERROR"
+            or len(self._pending_lines) >= self._FLUSH_BATCH_SIZE
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """バッファ中のログ行をファイルに書き出す
+
+        追記用のファイルディスクリプタをプロセス生存中開いたままにし、
+        1バッチを os.writev による1回のシステムコールで書き込む
+        （バッチごとの open/close を省く）。
+        """
+        if not self._pending_lines or not self._log_file_path:
+            return
+
         try:
-            with open(self._log_file_path, "a", encoding="utf-8") as f:
-                json.dump(log_entry.to_dict(), f, ensure_ascii=False)
-                f.write("\n")
+            if self._log_fd is None:
+                self._log_fd = os.open(
+                    str(self._log_file_path),
+                    os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                    0o600,
+                )
+
+            if hasattr(os, "writev"):
+                os.writev(self._log_fd, self._pending_lines)
+            else:
+                os.write(self._log_fd, b"".join(self._pending_lines))
+            self._pending_lines.clear()
         except Exception as e:
             # ログファイル書き込みエラーは標準エラー出力のみ
             print(f"ログファイル書き込みエラー: {e}", file=__import__("sys").stderr)
 
+    def close(self) -> None:
+        """未書き込み分をフラッシュしてログファイルを閉じる"""
+        self.flush()
+        if self._log_fd is not None:
+            try:
+                os.close(self._log_fd)
+            except OSError:
+                pass
+            self._log_fd = None
+
     def _log(
         self,
         level: str,
@@ -177,7 +249,7 @@ class Logger:
             self.error("config", "設定ファイル読み込み失敗", details)
 
     def log_display_detection(
-        self, display_config: DisplayConfiguration, success: bool
+        self, display_config: "DisplayConfiguration", success: bool
     ) -> None:
         """ディスプレイ検出のログ"""
         if success:
@@ -195,7 +267,7 @@ class Logger:
             self.error("display", "ディスプレイ検出失敗")
 
     def log_pattern_match(
-        self, match_result: MatchResult, current_screen_ids: list
+        self, match_result: "MatchResult", current_screen_ids: list
     ) -> None:
         """パターンマッチングのログ"""
         details = {
@@ -217,7 +289,7 @@ class Logger:
         else:
             self.warning("pattern", "マッチするパターンなし", details)
 
-    def log_command_execution(self, execution_result: ExecutionResult) -> None:
+    def log_command_execution(self, execution_result: "ExecutionResult") -> None:
         """コマンド実行のログ"""
         details = {
             "pattern_name": execution_result.pattern_name,
@@ -274,6 +346,9 @@ class Logger:
         if not self.log_entries:
             return
 
+        # サマリー表示時点でログファイルを最新化しておく
+        self.flush()
+
         summary = self.get_session_summary()
 
         print("\n" + "=" * 50)